@@ -1,3 +1,17 @@
-from .core import init_installer
+import importlib
 
-__all__ = ["init_installer"]
\ No newline at end of file
+__all__ = ["init_installer"]
+
+# Public names resolved on first access, so importing the package doesn't load
+# dearpygui, pywin32 or winreg until they are actually needed
+_LAZY_ATTRS = {
+    "init_installer": ".core",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
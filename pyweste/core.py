@@ -1,217 +1,222 @@
 import os
 import re
 import sys
-import shutil
+import stat
+import time
+import queue
+import atexit
+import logging
+import logging.handlers
+import functools
 import tomllib
-import dearpygui.dearpygui as dpg
-from pathlib import Path
-from typing import List, Tuple, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Tuple, Dict, Any, Optional, Callable, Set
 
-from .utils import browse_for_folder
-from .reg import setup_entries
+from .utils import copy_file
+
+logger = logging.getLogger(__name__)
+
+_COPY_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+_PARALLEL_COPY_THRESHOLD = 8
+_NON_ALNUM_RUN = re.compile(r'[^a-zA-Z0-9]+')
+_MTIME_TOLERANCE = 2.0  # FAT volumes store modification times with 2 second granularity
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_toml(toml_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    with open(toml_path, 'rb') as f:
+        return tomllib.load(f)
 
 
 def load_toml_config(toml_path: str) -> Dict[str, Any]:
-    """Load configuration from pyproject.toml file."""
+    """Load configuration from pyproject.toml file.
+
+    Parsed results are cached until the file's modification time or size
+    changes, so the returned dict must be treated as read-only.
+    """
     try:
-        with open(toml_path, 'rb') as f:
-            return tomllib.load(f)
+        st = os.stat(toml_path)
+        return _parse_toml(toml_path, st.st_mtime_ns, st.st_size)
     except FileNotFoundError:
-        print(f"ERROR: pyproject.toml file not found: {toml_path}")
+        logger.error("pyproject.toml file not found: %s", toml_path)
         return {}
     except Exception as e:
-        print(f"ERROR: Failed to load pyproject.toml configuration: {e}")
+        logger.error("Failed to load pyproject.toml configuration: %s", e)
         return {}
 
 
-def copy_files(source_files: List[Tuple[str, str]], install_path: str) -> bool:
-    """Copy source files to installation directory."""
+def _collect_tree(src_dir: str, dest_dir: str, dirs: Set[str], files: List[Tuple[str, str, os.stat_result]]):
+    """Append every directory and file under src_dir, mapped onto dest_dir.
+
+    Files carry the stat result from the directory listing (free on Windows),
+    so the copy step never has to stat its sources again. Paths stay plain
+    strings to avoid building a Path object per entry.
+    """
+    stack = [(os.fspath(src_dir), dest_dir)]
+    while stack:
+        current, target = stack.pop()
+        dirs.add(target)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append((entry.path, os.path.join(target, entry.name)))
+                else:
+                    files.append((entry.path, os.path.join(target, entry.name), entry.stat()))
+
+
+def _copy_always(src: str, dest: str, src_stat: os.stat_result) -> bool:
+    copy_file(src, dest, src_stat.st_size)
+    return True
+
+
+def _copy_if_changed(src: str, dest: str, src_stat: os.stat_result) -> bool:
+    """Copy src to dest unless dest already has the same size and modification time.
+
+    Returns whether the file was copied.
+    """
+    try:
+        dest_stat = os.stat(dest)
+    except OSError:
+        copy_file(src, dest, src_stat.st_size)
+        return True
+    
+    if (dest_stat.st_size != src_stat.st_size
+            or abs(dest_stat.st_mtime - src_stat.st_mtime) >= _MTIME_TOLERANCE):
+        copy_file(src, dest, src_stat.st_size)
+        return True
+    return False
+
+
+def _copy_pairs(files: List[Tuple[str, str, os.stat_result]],
+                progress_callback: Optional[Callable[[int, int], None]] = None,
+                copy_function: Callable[[str, str, os.stat_result], bool] = _copy_always) -> List[bool]:
+    """Copy (source, destination, source stat) entries, overlapping I/O across threads for larger batches.
+
+    Returns copy_function's result for each entry, in the order of files.
+    """
+    total = len(files)
+    
+    if total < _PARALLEL_COPY_THRESHOLD:
+        results = []
+        for copied, (src, dest, src_stat) in enumerate(files, 1):
+            results.append(copy_function(src, dest, src_stat))
+            if progress_callback:
+                progress_callback(copied, total)
+        return results
+    
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+        futures = [executor.submit(copy_function, src, dest, src_stat) for src, dest, src_stat in files]
+        try:
+            for copied, future in enumerate(as_completed(futures), 1):
+                future.result()
+                if progress_callback:
+                    progress_callback(copied, total)
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+    return [future.result() for future in futures]
+
+
+def copy_files(source_files: List[Tuple[str, str]], install_path: str,
+               progress_callback: Optional[Callable[[int, int], None]] = None,
+               skip_unchanged: bool = True) -> bool:
+    """Copy source files to installation directory.
+
+    If given, progress_callback is called as (copied_files, total_files) after
+    each file, always from the calling thread. With skip_unchanged, destination
+    files that already match the source's size and modification time are left
+    in place.
+    """
     if not source_files:
-        print("ERROR: No source files provided")
+        logger.error("No source files provided")
         return False
         
-    install_path = Path(install_path)
+    install_path = os.path.normpath(install_path)
+    dirs = {install_path}
+    files = []
     
     try:
-        install_path.mkdir(parents=True, exist_ok=True)
-        print(f"INFO: Created installation directory: {install_path}")
-        
+        # Expand every entry into one flat list so all files are copied in a single pass
         for src, rel_dest in source_files:
-            src_path = Path(src)
-            
-            if not src_path.exists():
-                print(f"ERROR: Source file/folder not found: {src}")
+            try:
+                src_stat = os.stat(src)
+            except FileNotFoundError:
+                logger.error("Source file/folder not found: %s", src)
                 return False
             
-            dest = install_path / rel_dest
+            dest = os.path.normpath(os.path.join(install_path, rel_dest))
             
-            if src_path.is_dir():
-                if rel_dest.endswith('/') or rel_dest.endswith('\\'):
-                    # Copy contents of source directory to destination
-                    dest = dest.parent / dest.name if dest.name else dest.parent
-                    dest.mkdir(parents=True, exist_ok=True)
-                    
-                    for item in src_path.iterdir():
-                        if item.is_dir():
-                            shutil.copytree(item, dest / item.name, dirs_exist_ok=True)
-                        else:
-                            shutil.copy2(item, dest / item.name)
-                    
-                    print(f"INFO: Copied directory contents: {src} -> {dest}")
-                else:
-                    # Copy entire directory to destination
-                    if dest.exists():
-                        shutil.rmtree(dest)
-                    shutil.copytree(src_path, dest)
-                    print(f"INFO: Copied directory: {src} -> {dest}")
+            if stat.S_ISDIR(src_stat.st_mode):
+                # Directories are merged into the destination; files already there are updated in place
+                _collect_tree(src, dest, dirs, files)
             else:
-                # Handle file copying
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dest)
-                print(f"INFO: Copied file: {src} -> {dest}")
+                if os.path.isdir(dest):
+                    # A file copied onto an existing directory goes inside it, as shutil.copy2 did
+                    dest = os.path.join(dest, os.path.basename(src))
+                dirs.add(os.path.dirname(dest))
+                files.append((src, dest, src_stat))
+        
+        # Create each distinct directory once; a parent's path is always shorter than its children's
+        for directory in sorted(dirs, key=len):
+            os.makedirs(directory, exist_ok=True)
+        logger.info("Created installation directory: %s", install_path)
         
-        print("INFO: All files/folders copied successfully")
+        start = time.perf_counter()
+        # Destination directories already exist, so worker threads never race on mkdir
+        results = _copy_pairs(files, progress_callback, _copy_if_changed if skip_unchanged else _copy_always)
+        
+        elapsed = time.perf_counter() - start
+        copied_count = skipped_count = copied_bytes = skipped_bytes = 0
+        for (_, _, src_stat), copied in zip(files, results):
+            if copied:
+                copied_count += 1
+                copied_bytes += src_stat.st_size
+            else:
+                skipped_count += 1
+                skipped_bytes += src_stat.st_size
+        logger.info("Copied %d files (%.1f MiB) in %.1fs; skipped %d unchanged files (%.1f MiB)",
+                    copied_count, copied_bytes / (1024 * 1024), elapsed,
+                    skipped_count, skipped_bytes / (1024 * 1024))
         return True
         
     except Exception as e:
-        print(f"ERROR: File copy operation failed: {e}")
+        logger.error("File copy operation failed: %s", e)
         return False
 
 
-class InstallerGUI:
-    def __init__(self, app_name: str, default_install_path: str, icon_path: str, source_files: List[Tuple[str, str]]):
-        self.app_name = app_name
-        self.default_install_path = default_install_path
-        self.icon_path = icon_path
-        self.source_files = source_files
-        self.installing = False
-        self.install_success = False
-        
-    def browse_folder(self):
-        """Browse for installation folder."""
-        folder_path = browse_for_folder("Select installation folder")
-        if folder_path:
-            full_path = str(Path(folder_path) / self.app_name)
-            dpg.set_value("install_path", full_path)
-    
-    def update_progress(self, progress: float, message: str):
-        """Update progress bar and status message."""
-        dpg.set_value("progress_bar", progress)
-        dpg.set_value("progress_text", message)
-        dpg.render_dearpygui_frame()
-    
-    def do_install(self):
-        """Handle complete installation process."""
-        if self.installing:
-            return
-        
-        self.installing = True
-        dpg.configure_item("install_button", show=False)
-        
-        install_path = dpg.get_value("install_path")
-        todo_desktop = dpg.get_value("desktop_shortcut")
-        todo_startmenu = dpg.get_value("startmenu_shortcut")
-        todo_registry = dpg.get_value("add_remove_programs")
-        
-        try:
-            # Step 1: Copy files
-            self.update_progress(0.25, "Copying files...")
-            if not copy_files(self.source_files, install_path):
-                raise Exception("File copying failed")
-            
-            # Step 2: Create shortcuts and registry
-            self.update_progress(0.75, "Creating shortcuts and registry entries...")
-            if todo_desktop or todo_startmenu or todo_registry:
-                run_bat_path = str(Path(install_path) / "run.bat")
-                icon_path = str(Path(install_path) / "bin" / "icon.ico")
-                icon_path = icon_path if Path(icon_path).exists() else None
-                
-                setup_entries(
-                    app_name=self.app_name,
-                    install_path=install_path,
-                    executable=run_bat_path,
-                    icon_path=icon_path,
-                    create_desktop=todo_desktop,
-                    create_startmenu=todo_startmenu,
-                    add_registry=todo_registry
-                )
-            
-            # Complete
-            self.update_progress(1.0, "Installation completed successfully!")
-            print(f"INFO: Installation of {self.app_name} completed successfully!")
-            self.install_success = True
-            
-            # Change button to Close when installation is successful
-            dpg.configure_item("install_button", label="Close", show=True)
-            
-        except Exception as e:
-            print(f"ERROR: Installation failed: {e}")
-            self.update_progress(0.0, f"Installation failed: {str(e)}")
-            dpg.configure_item("install_button", label="Install", show=True)
-            self.installing = False
+def _configure_logging():
+    """Send pyweste log records through a queue to a stdout writer thread.
+
+    QueueHandler still merges the message arguments on the logging thread,
+    but the level prefix and the console write happen on the listener
+    thread, so the install and UI threads never block on stdout. Safe to
+    call more than once.
+    """
+    package_logger = logging.getLogger(__package__)
+    if package_logger.handlers:
+        return
     
-    def install_clicked(self):
-        """Handle install/close button click."""
-        if self.install_success:
-            dpg.destroy_context()
-        else:
-            self.do_install()
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    listener.start()
+    # Flush anything still queued when the installer exits
+    atexit.register(listener.stop)
     
-    def run(self) -> bool:
-        dpg.create_context()
-        
-        with dpg.window(tag="main_window", width=450, height=300, 
-                       no_resize=True, no_collapse=True, no_title_bar=True):
-            
-            with dpg.group(horizontal=True):
-                dpg.add_spacer(width=15)
-                with dpg.group():                    
-                    dpg.add_spacer(height=25)
-                    with dpg.group(horizontal=True):
-                        dpg.add_input_text(tag="install_path", default_value=self.default_install_path, width=300)
-                        dpg.add_button(label="Browse", callback=self.browse_folder, width=70)
-                    
-                    dpg.add_spacer(height=20)
-                    dpg.add_checkbox(tag="desktop_shortcut", label="Create desktop shortcut", default_value=True)
-                    dpg.add_checkbox(tag="startmenu_shortcut", label="Create start menu shortcut", default_value=True)
-                    dpg.add_checkbox(tag="add_remove_programs", label="Add to Add/Remove Programs", default_value=True)
-                    
-                    dpg.add_spacer(height=15)
-                    dpg.add_text("Ready to install", tag="progress_text")
-                    dpg.add_spacer(height=15)
-                    
-                    with dpg.group(horizontal=True):
-                        dpg.add_progress_bar(tag="progress_bar", default_value=0.0, width=270, height=25)
-                        dpg.add_button(tag="install_button", label="Install", 
-                                     callback=self.install_clicked, width=100, height=25)
-        
-        dpg.create_viewport(title="Setup", width=470, height=320, resizable=False)
-        
-        if self.icon_path and Path(self.icon_path).exists():
-            dpg.set_viewport_small_icon(self.icon_path)
-            dpg.set_viewport_large_icon(self.icon_path)
-        
-        dpg.setup_dearpygui()
-        dpg.show_viewport()
-        dpg.set_primary_window("main_window", True)
-        dpg.start_dearpygui()
-        dpg.destroy_context()
-        
-        return self.install_success
+    package_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    package_logger.setLevel(logging.INFO)
+    package_logger.propagate = False
+
 
 def _sanitize_app_name(name: str) -> str:
-    # Trim surrounding whitespace
-    name = name.strip()
-    # Replace any non-alphanumeric with space
-    name = re.sub(r'[^a-zA-Z0-9]', ' ', name)
-    # Collapse multiple spaces
-    name = re.sub(r'\s+', ' ', name)
-    # Strip leading/trailing spaces again after collapsing
-    name = name.strip()
-    return name
+    # Replace each run of non-alphanumerics with a single space, then trim
+    return _NON_ALNUM_RUN.sub(' ', name).strip()
 
 def init_installer():
     """Initialize and start the installer."""
+    _configure_logging()
+    
     bin_directory = os.path.dirname(sys.executable)
     bundle_root = os.path.dirname(bin_directory)
     
@@ -219,21 +224,24 @@ def init_installer():
     config = load_toml_config(toml_path)
     
     if not config or 'project' not in config:
-        print("ERROR: Invalid pyproject.toml configuration")
+        logger.error("Invalid pyproject.toml configuration")
         return
     
     app_name = config['project']['name']
     app_name = _sanitize_app_name(app_name)
 
     icon_path = os.path.join(bin_directory, "icon.ico")
-    default_install_path = str(Path('C:/Program Files') / app_name)
+    default_install_path = os.path.join("C:\\Program Files", app_name)
     source_files = [(bundle_root + "/", "")]  # Copy entire bundle directory contents
     
-    print(f"INFO: Starting GUI installer for: {app_name}")
-    print(f"INFO: Default install path: {default_install_path}")
-    print(f"INFO: Will copy entire bundle directory: {bundle_root}")
+    logger.info("Starting GUI installer for: %s", app_name)
+    logger.info("Default install path: %s", default_install_path)
+    logger.info("Will copy entire bundle directory: %s", bundle_root)
     
     try:
+        # Imported here so the copy and config helpers don't pay for loading the GUI stack
+        from .gui import InstallerGUI
+        
         gui = InstallerGUI(
             app_name=app_name,
             default_install_path=default_install_path,
@@ -242,4 +250,4 @@ def init_installer():
         )
         gui.run()
     except Exception as e:
-        print(f"ERROR: Installer failed: {e}")
\ No newline at end of file
+        logger.error("Installer failed: %s", e)
\ No newline at end of file
@@ -0,0 +1,253 @@
+import os
+import time
+import logging
+import threading
+import dearpygui.dearpygui as dpg
+from typing import List, Tuple
+
+from .core import copy_files
+from .utils import browse_for_folder
+from .reg import setup_entries
+
+logger = logging.getLogger(__name__)
+
+_IDLE_FRAME_INTERVAL = 1 / 30
+_INSTALL_FRAME_INTERVAL = 1 / 60
+_RELATIVE_ICON = os.path.join("bin", "icon.ico")
+_FINISHING_MESSAGE = "Finishing installation..."
+
+
+class InstallerGUI:
+    def __init__(self, app_name: str, default_install_path: str, icon_path: str, source_files: List[Tuple[str, str]]):
+        self.app_name = app_name
+        self.default_install_path = default_install_path
+        self.icon_path = icon_path
+        self.source_files = source_files
+        self.installing = False
+        self.install_success = False
+        self._browsing = False
+        self._picked_install_path = None
+        self._progress = (0.0, "Ready to install", "Install")
+        self._drawn_progress = self._progress
+        self._install_thread = None
+        self._close_requested = False
+        
+    def browse_folder(self):
+        """Open the folder picker on its own thread so the window keeps rendering."""
+        if self._browsing or self.installing:
+            return
+        self._browsing = True
+        threading.Thread(target=self._browse_worker, daemon=True).start()
+    
+    def _browse_worker(self):
+        """Run the modal Shell dialog; browse_for_folder sets up COM for this thread."""
+        try:
+            folder_path = browse_for_folder("Select installation folder")
+            if folder_path:
+                # Applied by the render loop, which owns the widgets
+                self._picked_install_path = os.path.join(folder_path, self.app_name)
+        finally:
+            self._browsing = False
+    
+    def update_progress(self, progress: float, message: str, button_label: str = None):
+        """Record progress from the install thread; it is drawn on the next frame.
+
+        The install button is hidden while button_label is None.
+        """
+        # A single tuple assignment, so the UI thread always sees a consistent state
+        self._progress = (progress, message, button_label)
+    
+    def _draw_progress(self):
+        """Push the latest progress, button state and picked folder to the widgets, at most once per frame.
+
+        Only the render loop calls this, so widgets are never changed from the
+        install or folder picker threads.
+        """
+        self._apply_picked_path()
+        
+        progress = self._progress
+        if progress is not self._drawn_progress:
+            dpg.set_value("progress_bar", progress[0])
+            dpg.set_value("progress_text", _FINISHING_MESSAGE if self._close_requested else progress[1])
+            button_label = progress[2]
+            if button_label != self._drawn_progress[2]:
+                if button_label is None:
+                    dpg.configure_item("install_button", show=False)
+                else:
+                    dpg.configure_item("install_button", label=button_label, show=True)
+            self._drawn_progress = progress
+    
+    def _apply_picked_path(self):
+        """Write a folder chosen in the picker into the path box, unless an install already started."""
+        picked = self._picked_install_path
+        if picked is not None:
+            self._picked_install_path = None
+            # The box must keep showing the path actually being installed to
+            if not self.installing:
+                dpg.set_value(self._install_path_id, picked)
+    
+    def copy_progress(self, copied: int, total: int):
+        """Map per-file copy progress onto the copy step of the progress bar."""
+        self.update_progress(0.75 * copied / total, f"Copying files... ({copied}/{total})")
+    
+    def entries_progress(self, completed: int, total: int):
+        """Map shortcut/registry step progress onto the rest of the progress bar."""
+        self.update_progress(0.75 + 0.25 * completed / total, f"Creating shortcuts and registry entries... ({completed}/{total})")
+    
+    def do_install(self):
+        """Read the install options and start the installation on a background thread."""
+        # The picker has no owner window, so Install stays clickable while it is open;
+        # wait for its result instead of installing to the old path
+        if self.installing or self._browsing:
+            return
+        
+        # A folder picked since the last frame is installed to, not the one on screen
+        self._apply_picked_path()
+        self.installing = True
+        self.update_progress(0.0, "Preparing installation...")
+        
+        install_path, todo_desktop, todo_startmenu, todo_registry = dpg.get_values(
+            [self._install_path_id, self._desktop_id, self._startmenu_id, self._reg_id])
+        
+        # Run the install off the UI thread so the window keeps rendering
+        self._install_thread = threading.Thread(
+            target=self._install_worker,
+            args=(install_path, todo_desktop, todo_startmenu, todo_registry),
+            daemon=True
+        )
+        self._install_thread.start()
+    
+    def _install_worker(self, install_path: str, todo_desktop: bool, todo_startmenu: bool, todo_registry: bool):
+        """Copy files and create shortcuts/registry entries on the install thread."""
+        try:
+            # Step 1: Copy files
+            self.update_progress(0.0, "Copying files...")
+            if not copy_files(self.source_files, install_path, progress_callback=self.copy_progress):
+                raise Exception("File copying failed")
+            
+            # Step 2: Create shortcuts and registry
+            self.update_progress(0.75, "Creating shortcuts and registry entries...")
+            if todo_desktop or todo_startmenu or todo_registry:
+                run_bat_path = os.path.join(install_path, "run.bat")
+                icon_path = os.path.join(install_path, _RELATIVE_ICON)
+                icon_path = icon_path if os.path.exists(icon_path) else None
+                
+                setup_entries(
+                    app_name=self.app_name,
+                    install_path=install_path,
+                    executable=run_bat_path,
+                    icon_path=icon_path,
+                    create_desktop=todo_desktop,
+                    create_startmenu=todo_startmenu,
+                    add_registry=todo_registry,
+                    progress_callback=self.entries_progress
+                )
+            
+            # Complete; the button turns into Close in the same update as the final progress
+            self.update_progress(1.0, "Installation completed successfully!", "Close")
+            logger.info("Installation of %s completed successfully!", self.app_name)
+            # Flip the flag only once the final state is published, so the frame that
+            # sees the install finish also draws it
+            self.install_success = True
+            
+        except Exception as e:
+            logger.error("Installation failed: %s", e)
+            self.update_progress(0.0, f"Installation failed: {str(e)}", "Install")
+            self.installing = False
+    
+    def install_clicked(self):
+        """Handle install/close button click."""
+        if self.install_success:
+            dpg.stop_dearpygui()
+        else:
+            self.do_install()
+    
+    def close_requested(self):
+        """Handle the viewport close button; an install in progress is finished first."""
+        if self.installing and not self.install_success:
+            # The render loop stops once the install thread is done
+            self._close_requested = True
+            dpg.set_value("progress_text", _FINISHING_MESSAGE)
+        else:
+            dpg.stop_dearpygui()
+    
+    def run(self) -> bool:
+        dpg.create_context()
+        # Only redraw on user input while idle; switched off while an install is running.
+        # Callbacks are run from the render loop, so they can't race it into a blocking frame
+        dpg.configure_app(wait_for_input=True, manual_callback_management=True)
+        waiting_for_input = True
+        
+        with dpg.window(tag="main_window", width=450, height=300, 
+                       no_resize=True, no_collapse=True, no_title_bar=True):
+            
+            with dpg.group(horizontal=True):
+                dpg.add_spacer(width=15)
+                with dpg.group():                    
+                    dpg.add_spacer(height=25)
+                    with dpg.group(horizontal=True):
+                        # Keep the item ids so callbacks don't look widgets up by tag
+                        self._install_path_id = dpg.add_input_text(default_value=self.default_install_path, width=300)
+                        dpg.add_button(label="Browse", callback=self.browse_folder, width=70)
+                    
+                    dpg.add_spacer(height=20)
+                    self._desktop_id = dpg.add_checkbox(label="Create desktop shortcut", default_value=True)
+                    self._startmenu_id = dpg.add_checkbox(label="Create start menu shortcut", default_value=True)
+                    self._reg_id = dpg.add_checkbox(label="Add to Add/Remove Programs", default_value=True)
+                    
+                    dpg.add_spacer(height=15)
+                    dpg.add_text("Ready to install", tag="progress_text")
+                    dpg.add_spacer(height=15)
+                    
+                    with dpg.group(horizontal=True):
+                        dpg.add_progress_bar(tag="progress_bar", default_value=0.0, width=270, height=25)
+                        dpg.add_button(tag="install_button", label="Install", 
+                                     callback=self.install_clicked, width=100, height=25)
+        
+        # Closing is routed through close_requested, so the window can't vanish mid-install
+        dpg.create_viewport(title="Setup", width=470, height=320, resizable=False, vsync=False,
+                            disable_close=True)
+        dpg.set_exit_callback(self.close_requested)
+        
+        if self.icon_path and os.path.exists(self.icon_path):
+            dpg.set_viewport_small_icon(self.icon_path)
+            dpg.set_viewport_large_icon(self.icon_path)
+        
+        dpg.setup_dearpygui()
+        # Finish all viewport state before showing it, so the first presented frame is final
+        dpg.set_primary_window("main_window", True)
+        dpg.show_viewport()
+        
+        while dpg.is_dearpygui_running():
+            frame_start = time.perf_counter()
+            # Run this frame's clicks first, so the flags they set are seen before the next
+            # frame can block waiting for input
+            dpg.run_callbacks(dpg.get_callback_queue())
+            # Read the flags before drawing: the workers publish their final state before
+            # flipping them, so that state is drawn before waiting is switched back on
+            installing = self.installing and not self.install_success
+            if self._close_requested and not installing:
+                break
+            # Keep rendering while the folder picker is open, so the picked path shows without input
+            active = installing or self._browsing
+            if active and waiting_for_input:
+                dpg.configure_app(wait_for_input=False)
+                waiting_for_input = False
+            
+            self._draw_progress()
+            dpg.render_dearpygui_frame()
+            
+            # Re-enable waiting only after the final progress state has been drawn
+            if not active and not waiting_for_input:
+                dpg.configure_app(wait_for_input=True)
+                waiting_for_input = True
+            
+            # Cap the frame rate; render faster only while the progress bar is moving
+            interval = _INSTALL_FRAME_INTERVAL if installing else _IDLE_FRAME_INTERVAL
+            remaining = interval - (time.perf_counter() - frame_start)
+            if remaining > 0:
+                time.sleep(remaining)
+        
+        dpg.destroy_context()
+        
+        return self.install_success
@@ -1,9 +1,14 @@
 import os
 import winreg
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable, Optional
 from .utils import create_shortcut, calculate_directory_size
 from .uins import create_uninstaller_script
 
+logger = logging.getLogger(__name__)
+
 def add_registry_entry(app_name: str, install_path: str, uninstall_script_path: str, icon_path: str = None) -> bool:
     """Add registry entry for Add/Remove Programs."""
     try:
@@ -24,39 +29,59 @@ def add_registry_entry(app_name: str, install_path: str, uninstall_script_path:
             uninstall_cmd = f'cmd.exe /c "{uninstall_script_path}"'
             winreg.SetValueEx(key, "UninstallString", 0, winreg.REG_SZ, uninstall_cmd)
 
-        print(f"INFO: Registry entry created for {app_name}")
+        logger.info("Registry entry created for %s", app_name)
         return True
         
     except Exception as e:
-        print(f"ERROR: Failed to add registry entry: {e}")
+        logger.error("Failed to add registry entry: %s", e)
         return False
 
 
+def _add_uninstall_entry(app_name: str, install_path: str, icon_path: str = None) -> bool:
+    """Write uninstall.bat and register it in Add/Remove Programs."""
+    uninstall_script_path = create_uninstaller_script(app_name, install_path)
+    if not uninstall_script_path:
+        return False
+    return add_registry_entry(app_name, install_path, uninstall_script_path, icon_path)
+
+
 def setup_entries(app_name: str, install_path: str, executable: str, icon_path: str = None,
-                   create_desktop: bool = False, create_startmenu: bool = False, add_registry: bool = False) -> bool:
-    """Add application to Windows registry and create shortcuts."""
-    success = True
+                   create_desktop: bool = False, create_startmenu: bool = False, add_registry: bool = False,
+                   progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
+    """Add application to Windows registry and create shortcuts.
+
+    The selected steps are independent of each other and run concurrently.
+    If given, progress_callback is called as (completed_steps, total_steps)
+    from the calling thread as each step finishes.
+    """
+    tasks = []
     
     # Create desktop shortcut
     if create_desktop:
         desktop_path = str(Path.home() / "Desktop" / f"{app_name}.lnk")
-        if not create_shortcut(executable, desktop_path, icon_path):
-            success = False
+        tasks.append((create_shortcut, executable, desktop_path, icon_path))
     
     # Create start menu shortcut
     if create_startmenu:
         appdata = os.environ.get('APPDATA', str(Path.home() / 'AppData' / 'Roaming'))
         startmenu_path = Path(appdata) / "Microsoft" / "Windows" / "Start Menu" / "Programs" / f"{app_name}.lnk"
-        if not create_shortcut(executable, str(startmenu_path), icon_path):
-            success = False
+        tasks.append((create_shortcut, executable, str(startmenu_path), icon_path))
     
     # Add to registry (Add/Remove Programs)
     if add_registry:
-        uninstall_script_path = create_uninstaller_script(app_name, install_path)
-        if uninstall_script_path:
-            if not add_registry_entry(app_name, install_path, uninstall_script_path, icon_path):
+        tasks.append((_add_uninstall_entry, app_name, install_path, icon_path))
+    
+    if not tasks:
+        return True
+    
+    success = True
+    # Each step reports its own failure and returns False, so one failing step never cancels the others
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [executor.submit(*task) for task in tasks]
+        for completed, future in enumerate(as_completed(futures), 1):
+            if not future.result():
                 success = False
-        else:
-            success = False
+            if progress_callback:
+                progress_callback(completed, len(tasks))
     
-    return success
\ No newline at end of file
+    return success
@@ -1,12 +1,9 @@
+import logging
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
 
-def create_uninstaller_script(app_name: str, install_path: str) -> str:
-    """Create an uninstallation script."""
-    install_path = Path(install_path)
-    uninstall_script_path = install_path / "uninstall.bat"
-    
-    uninstall_content = f'''@echo off
+_UNINSTALL_TEMPLATE = '''@echo off
 net session >nul 2>&1
 if %errorLevel% neq 0 (
     echo Requesting administrator privileges...
@@ -22,17 +19,29 @@ del "%APPDATA%\\Microsoft\\Windows\\Start Menu\\Programs\\{app_name}.lnk" 2>nul
 reg delete "HKCU\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\{app_name}" /f 2>nul
 reg delete "HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\{app_name}" /f 2>nul
 
-cd /d "{install_path.parent}"
-rmdir /s /q "{install_path.name}" 2>nul
+cd /d "{install_parent}"
+rmdir /s /q "{install_name}" 2>nul
 
 echo {app_name} has been uninstalled successfully.
 timeout /t 3 >nul
 '''
+
+
+def create_uninstaller_script(app_name: str, install_path: str) -> str:
+    """Create an uninstallation script."""
+    install_path = Path(install_path)
+    uninstall_script_path = install_path / "uninstall.bat"
+    
+    uninstall_content = _UNINSTALL_TEMPLATE.format_map({
+        'app_name': app_name,
+        'install_parent': install_path.parent,
+        'install_name': install_path.name,
+    })
     
     try:
-        with open(uninstall_script_path, 'w', encoding='utf-8') as f:
-            f.write(uninstall_content)
+        # Batch files use CRLF line endings regardless of the platform writing them
+        uninstall_script_path.write_text(uninstall_content, encoding='utf-8', newline='\r\n')
         return str(uninstall_script_path)
     except Exception as e:
-        print(f"ERROR: Failed to create uninstaller: {e}")
+        logger.error("Failed to create uninstaller: %s", e)
         return None
\ No newline at end of file